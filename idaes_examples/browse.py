@@ -289,6 +289,9 @@ class Jupyter:
             p.wait(timeout=5)
             _log.info(f"(end) stop running notebook, port={port}: Success")
         except TimeoutExpired:
+            # don't leave the 'stop' command running in the background
+            p.kill()
+            p.wait()
             _log.info(f"(end) stop running notebook, port={port}: Timeout")
 
 
@@ -4,12 +4,14 @@ Build the examples
 import argparse
 import json
 import logging
+import os
 from pathlib import Path
 import re
 from subprocess import check_call
 import sys
 import time
 import traceback
+from typing import Dict
 import webbrowser
 
 # package
@@ -55,9 +57,10 @@ def preprocess(srcdir=None):
     src_path /= NB_ROOT
     toc = read_toc(src_path)
     t0 = time.time()
-    n = find_notebooks(src_path, toc, _preprocess)
+    dir_entries = {}  # shared listing of each notebook directory
+    n = find_notebooks(src_path, toc, _preprocess, dir_entries=dir_entries)
     for dev_file in (src_path / DEV_DIR).glob(f"*{src_suffix}.ipynb"):
-        _preprocess(dev_file)
+        _preprocess(dev_file, dir_entries=dir_entries)
     dur = time.time() - t0
     _log.info(f"Preprocessed {n} notebooks in {dur:.1f} seconds")
     return n
@@ -80,7 +83,19 @@ nb_file_subs = {e.value: f"\\1_{e.value}.ipynb" for e in Ext if e != Ext.DOC}
 nb_file_subs[Ext.DOC.value] = f"\\1_{Ext.DOC.value}.md"
 
 
-def _preprocess(nb_path: Path, **kwargs):
+def _list_dir(p: Path, dir_entries: Dict[Path, Dict[str, os.DirEntry]]):
+    """Return {name: entry} for the files in directory 'p', listing it only once.
+
+    Looking names up here avoids a stat() for derived notebooks that do not
+    exist, and `DirEntry.stat()` caches its result.
+    """
+    if p not in dir_entries:
+        with os.scandir(p) as entries:
+            dir_entries[p] = {e.name: e for e in entries}
+    return dir_entries[p]
+
+
+def _preprocess(nb_path: Path, dir_entries=None, **kwargs):
     _log.info(f"Preprocess: {nb_path}")
 
     def ext_path(p: Path, ext: Ext = None, name: str = None) -> Path:
@@ -93,10 +108,12 @@ def _preprocess(nb_path: Path, **kwargs):
     t0 = time.time()
 
     # Check whether source was changed after any of the derived notebooks
+    entries = _list_dir(nb_path.parent, {} if dir_entries is None else dir_entries)
     src_mtime, changed = nb_path.stat().st_mtime, False
     for ext in Ext:
-        p_ext = ext_path(nb_path, ext=ext)
-        if not p_ext.exists() or p_ext.stat().st_mtime <= src_mtime:
+        entry = entries.get(ext_path(nb_path, ext=ext).name, None)
+        # a missing file counts as out of date
+        if entry is None or entry.stat().st_mtime <= src_mtime:
             changed = True
             break
     if not changed:
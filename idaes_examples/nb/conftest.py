@@ -10,6 +10,7 @@ g_pre = -1  # number of pre-processed notebooks
 
 def pytest_configure(config):
     global g_pre
+    config.addinivalue_line("markers", "slow: marks tests as slow")
     if g_pre < 0:
         g_pre = 0
         p = Path(build.__file__).parent
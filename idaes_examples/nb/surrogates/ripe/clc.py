@@ -17,7 +17,7 @@ from idaes.surrogate.ripe import mechs as mechs
 def main():
     spec = ['X']
     # Import data from csv
-    data = np.genfromtxt('clc.csv', delimiter=',')
+    data = np.loadtxt('clc.csv', delimiter=',')
     t = data[:,0]
     xdata = data[:,1]
     stoich = [1]
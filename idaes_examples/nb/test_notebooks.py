@@ -14,23 +14,30 @@
 Tests for notebooks (without running them)
 """
 # stdlib
-import os
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-import subprocess
-from typing import List
+from typing import List, Optional
 
 # third-party
 import pytest
 
 # package
-from idaes_examples.util import read_toc, find_notebooks
+from idaes_examples.util import (
+    read_toc,
+    find_notebooks,
+    src_suffix,
+    NB_CELLS,
+    Tags,
+)
 
 
 # -------------------
 #  Fixtures
 # -------------------
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def notebooks() -> List[Path]:
     src_path = find_toc(Path(__file__).parent)
     assert src_path is not None, "Cannot find _toc.yml"
@@ -45,6 +52,16 @@ def notebooks() -> List[Path]:
     return notebooks
 
 
+def src_notebooks(p: Path) -> List[Path]:
+    """Find all source notebooks under 'p', skipping Jupyter checkpoints."""
+    return [
+        nb_path
+        for nb_path in sorted(p.rglob(f"*{src_suffix}.ipynb"))
+        if ".ipynb_checkpoints" not in nb_path.parts
+    ]
+
+
+@lru_cache(maxsize=None)
 def find_toc(p: Path):
     """Walk up from 'p' looking for the '_toc.yml' file"""
     while p != p.parent:
@@ -61,27 +78,65 @@ def find_toc(p: Path):
 def test_smoke(notebooks: List[Path]):
     assert len(notebooks) > 0
     for nb_path in notebooks:
-        assert nb_path.exists()
+        # stat() fails for a missing file, so no separate exists() check
         assert nb_path.stat().st_size > 0
 
 
-# Use 'black --check' to test whether syntax is OK in Jupyter notebooks.
+def black_check(nb_path: Path) -> Optional[str]:
+    """Check formatting of one notebook with black.
+
+    Returns:
+        None if the notebook is OK, otherwise a description of the problem
+    """
+    import black
+
+    try:
+        changed = black.format_file_in_place(
+            nb_path, fast=False, mode=black.Mode(), write_back=black.WriteBack.CHECK
+        )
+    except Exception as err:
+        return f"cannot format: {err}"
+    return "would reformat" if changed else None
+
+
+# Compile code cells to test whether syntax is OK in Jupyter notebooks.
+# IPython is used to turn magics (%, !) into plain Python first.
+def test_syntax():
+    inputtransformer = pytest.importorskip("IPython.core.inputtransformer2")
+    transformer = inputtransformer.TransformerManager()
+    failed_names = set()
+    for nb_path in src_notebooks(Path(__file__).parent):
+        with nb_path.open("r", encoding="utf-8") as nb_file:
+            nb = json.load(nb_file)
+        for cell_index, cell in enumerate(nb[NB_CELLS]):
+            if cell["cell_type"] != "code":
+                continue
+            # exercise cells are left incomplete on purpose
+            if Tags.EX.value in cell["metadata"].get("tags", []):
+                continue
+            code = transformer.transform_cell("".join(cell["source"]))
+            try:
+                compile(code, f"{nb_path}[{cell_index}]", "exec")
+            except SyntaxError as err:
+                # print out errors for pytest's captured stdout
+                failed_names.add(str(nb_path))
+                print(f"FAILED: {nb_path}: cell {cell_index}: {err}")
+    assert not failed_names, "Syntax check failed"
+
+
+# Use black to test whether code in Jupyter notebooks is formatted.
 # This requires that black[jupyter] has been installed.
+@pytest.mark.slow
 def test_black():
-    working_dir = Path(__file__).parent
-    command = ["black", "--check", "--include", ".*_src\\.ipynb", str(working_dir)]
-    proc = subprocess.Popen(command, stderr=subprocess.PIPE)
-    _, stderr_data = proc.communicate(timeout=20)
-    if proc.returncode != 0:
-        # print out errors for pytest's captured stdout
-        failed_names = []
-        for line in stderr_data.decode("utf-8").split(os.linesep):
-            if line.startswith("would"):
-                tokens = line.split()
-                name = "??"
-                for i, tok in enumerate(tokens):
-                    if '\\' in tok or '/' in tok:
-                        name = ' '.join(tokens[i:])
-                        break
-                print(f"FAILED: {name}")
-        assert False, f"Black format check failed"
+    pytest.importorskip("black")
+    nb_paths = src_notebooks(Path(__file__).parent)
+    # notebooks are checked independently, so spread them over processes
+    with ProcessPoolExecutor() as executor:
+        problems = list(executor.map(black_check, nb_paths, chunksize=4))
+    failed_names = []
+    for nb_path, problem in zip(nb_paths, problems):
+        if problem is not None:
+            # print out errors for pytest's captured stdout
+            failed_names.append(str(nb_path))
+            print(f"FAILED: {nb_path}: {problem}")
+    assert not failed_names, "Black format check failed"
@@ -3,13 +3,20 @@ Common variables and methods for tests and scripts.
 """
 # stdlib
 from enum import Enum
+from functools import lru_cache
 import logging
+import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator
 
 # third-party
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
 src_suffix = "_src"
 src_suffix_len = 4
 
@@ -81,20 +88,30 @@ def allow_repo_root(src_path, func) -> Path:
 def read_toc(src_path: Path) -> Dict:
     """Read and parse Jupyterbook table of contents.
 
+    The parsed result is cached until the TOC file is modified.
+
     Args:
         src_path: Path to source directory containing TOC file
 
     Returns:
-        Parsed TOC contents
+        Parsed TOC contents (shared between callers, do not modify)
 
     Raises:
         FileNotFoundError: If TOC file does not exist
     """
     toc_path = src_path / "_toc.yml"
-    if not toc_path.exists():
+    try:
+        mtime = toc_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Could not find path: {toc_path}")
+    return _load_toc(toc_path, mtime)
+
+
+@lru_cache(maxsize=32)
+def _load_toc(toc_path: Path, mtime: int) -> Dict:
+    # 'mtime' is only part of the cache key, so edits to the file are seen
     with toc_path.open() as toc_file:
-        toc = yaml.safe_load(toc_file)
+        toc = yaml.load(toc_file, Loader=YamlLoader)
     return toc
 
 
@@ -126,3 +143,23 @@ def find_notebooks(
                 else:
                     raise FileNotFoundError(f"Could not find notebook at: {path}")
     return n
+
+
+def iter_src_notebooks(path: Path) -> Iterator[Path]:
+    """Find source notebooks in a directory (not recursive).
+
+    Args:
+        path: Directory to look in
+
+    Returns:
+        Iterator over paths of source notebooks; empty if `path` does not exist
+    """
+    try:
+        entries = os.scandir(path)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            # entries know their file type, so this needs no extra stat()
+            if entry.name.endswith(f"{src_suffix}.ipynb") and entry.is_file():
+                yield Path(entry.path)
@@ -6,6 +6,8 @@ from pathlib import Path
 import shutil
 import yaml
 
+from idaes_examples.util import YamlLoader
+
 
 def copy_files(dirmap: dict, src: Path, tgt: Path, ow: bool = False):
     for item in dirmap["map"]:
@@ -55,7 +57,7 @@ def main():
     args = p.parse_args()
     #
     with open(args.map, "r", encoding="utf-8") as mapfile:
-        dirmap = yaml.safe_load(mapfile)
+        dirmap = yaml.load(mapfile, Loader=YamlLoader)
         print(f"Loaded map from '{mapfile.name}'")
     copy_files(dirmap, Path(args.source_dir), Path(args.target_dir), ow=args.overwrite)
 
@@ -6,12 +6,14 @@ from pathlib import Path
 import json
 import yaml
 
+from idaes_examples.util import iter_src_notebooks, YamlLoader
+
 
 def edit_tags(m: dict, d: Path):
     for item in m["map"]:
         for _, dirname in item.items():
             p = d / dirname
-            for nb in p.glob("*_src.ipynb"):
+            for nb in iter_src_notebooks(p):
                 print(f"Edit tags in notebook '{nb}'")
                 with nb.open("r", encoding="utf-8") as f:
                     data = json.load(f)
@@ -45,7 +47,7 @@ def main():
     args = p.parse_args()
     #
     with open(args.map, "r", encoding="utf-8") as mapfile:
-        dirmap = yaml.safe_load(mapfile)
+        dirmap = yaml.load(mapfile, Loader=YamlLoader)
         print(f"Loaded map from '{mapfile.name}'")
     edit_tags(dirmap, Path(args.target_dir))
 
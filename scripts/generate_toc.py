@@ -9,6 +9,8 @@ import re
 import sys
 import yaml
 
+from idaes_examples.util import iter_src_notebooks, YamlLoader
+
 
 class TableOfContents:
     def __init__(self, m: dict, d: Path):
@@ -27,7 +29,7 @@ class TableOfContents:
                 self._add_index(p)
                 self._add_chapter(dirname)
                 print(f"Look for notebooks in '{p}'")
-                for nb in p.glob("*_src.ipynb"):
+                for nb in iter_src_notebooks(p):
                     filename = nb.stem[:-4]
                     self._add_section(dirname, filename)
 
@@ -67,7 +69,7 @@ def main():
     args = p.parse_args()
     #
     with open(args.map, "r", encoding="utf-8") as mapfile:
-        dirmap = yaml.safe_load(mapfile)
+        dirmap = yaml.load(mapfile, Loader=YamlLoader)
         print(f"Loaded map from '{mapfile.name}'")
     toc = TableOfContents(dirmap, Path(args.target_dir))
     if args.output is None: